@@ -0,0 +1,77 @@
+# This file is a part of WTFIX.
+#
+# Copyright (C) 2018-2021 John Cass <john.cass77@gmail.com>
+#
+# WTFIX is free software; you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or (at
+# your option) any later version.
+#
+# WTFIX is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public
+# License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+Compiles the .env file into a Python module that the settings can load instead of parsing .env on every startup.
+
+Usage:
+    python -m config.envcache [path_to_dotenv_file]
+"""
+import os
+import pprint
+import sys
+
+from dotenv import dotenv_values
+
+CACHE_PATH = os.path.join(os.path.dirname(__file__), "_env_cache.py")
+SETTINGS_DIR = os.path.join(os.path.dirname(__file__), "settings")
+
+
+def find_env_file(filename=".env"):
+    """
+    Searches for the .env file in the settings directory and each of its parents in turn, the same way that
+    load_dotenv() would when called from the settings module. Used both for compiling the cache and as the
+    fallback in the settings, so that both always pick up the same file regardless of the working directory.
+
+    :return: the path to the .env file, or an empty string if no file could be found.
+    """
+    path = os.path.abspath(SETTINGS_DIR)
+
+    while True:
+        candidate = os.path.join(path, filename)
+        if os.path.isfile(candidate):
+            return candidate
+
+        parent = os.path.dirname(path)
+        if parent == path:
+            # Reached the root directory
+            return ""
+
+        path = parent
+
+
+def compile_env(dotenv_path=None, cache_path=CACHE_PATH):
+    if dotenv_path is None:
+        dotenv_path = find_env_file()
+
+    # Skip keys without values: load_dotenv() does not set those either.
+    env = {
+        key: value
+        for key, value in dotenv_values(dotenv_path).items()
+        if value is not None
+    }
+
+    with open(cache_path, "w", encoding="utf-8") as f:
+        f.write(
+            f"# Generated from '{dotenv_path}' by 'python -m config.envcache'. Do not edit.\n"
+        )
+        f.write(f"ENV = {pprint.pformat(env)}\n")
+
+    return cache_path
+
+
+if __name__ == "__main__":
+    print(f"Compiled .env values to '{compile_env(*sys.argv[1:2])}'.")
@@ -3,18 +3,35 @@ Base settings to build other settings files upon.
 """
 import logging
 import os
-from distutils.util import strtobool
-from pathlib import Path
 
 from dotenv import load_dotenv
 
-load_dotenv()
+if not os.environ.get("_WTFIX_DOTENV_LOADED"):
+    # Only parse the .env file once, even if the settings modules are reloaded.
+    try:
+        # Use the pre-compiled .env values if available (see: config/envcache.py).
+        from .._env_cache import ENV
 
-ROOT_DIR = Path(__file__).parents[3]  # (wtfix/config/settings/base.py - 3 = wtfix/)
+        # Don't override existing variables, same as load_dotenv().
+        for key, value in ENV.items():
+            os.environ.setdefault(key, value)
+    except ImportError:
+        from ..envcache import find_env_file
+
+        load_dotenv(find_env_file())
+
+    os.environ["_WTFIX_DOTENV_LOADED"] = "1"
+
+# Snapshot the environment once, rather than looking up each variable separately.
+_env = dict(os.environ)
+
+ROOT_DIR = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)  # (wtfix/config/settings/base.py - 3 = wtfix/)
 
 # GENERAL
 # ------------------------------------------------------------------------------
-DEBUG = strtobool(os.getenv("DEBUG", "False"))
+DEBUG = _env.get("DEBUG", "False").lower() in ("y", "yes", "t", "true", "on", "1")
 LOGGING_LEVEL = logging.INFO
 
 # Local time zone. Choices are
@@ -27,21 +44,29 @@ USE_TZ = True
 # REDIS
 # ------------------------------------------------------------------------------
 # WTFIX message store (LRU cache) and Redis Pub/Sub for sending and receiving messages
-REDIS_WTFIX_URI = os.getenv("REDIS_WTFIX_URI", "redis://localhost:6379/0")
+REDIS_WTFIX_URI = _env.get("REDIS_WTFIX_URI", "redis://localhost:6379/0")
+
+# REST API
+# ------------------------------------------------------------------------------
+# Address that the RESTfulServiceApp's API server listens on
+REST_API_HOST = _env.get("REST_API_HOST", "127.0.0.1")
+REST_API_PORT = int(_env.get("REST_API_PORT", 5000))
 
 # CONNECTIONS
 # ------------------------------------------------------------------------------
+_sender = _env.get("SENDER")
+
 CONNECTIONS = {
     "default": {
         "HEARTBEAT_INT": 30,
-        "HOST": os.getenv("HOST"),
-        "PORT": os.getenv("PORT"),
-        "SSL_ENABLED": bool(os.getenv("SSL_ENABLED", False)),
-        "SSL_SKIP_VERIFY": bool(os.getenv("SSL_SKIP_VERIFY", False)),
-        "SENDER": os.getenv("SENDER"),
-        "TARGET": os.getenv("TARGET"),
-        "USERNAME": os.getenv("USERNAME", os.getenv("SENDER")),
-        "PASSWORD": os.getenv("PASSWORD"),
+        "HOST": _env.get("HOST"),
+        "PORT": _env.get("PORT"),
+        "SSL_ENABLED": bool(_env.get("SSL_ENABLED", False)),
+        "SSL_SKIP_VERIFY": bool(_env.get("SSL_SKIP_VERIFY", False)),
+        "SENDER": _sender,
+        "TARGET": _env.get("TARGET"),
+        "USERNAME": _env.get("USERNAME", _sender),
+        "PASSWORD": _env.get("PASSWORD"),
         # APPS
         "PIPELINE_APPS": [
             "wtfix.apps.utils.PipelineTerminationApp",
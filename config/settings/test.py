@@ -7,14 +7,16 @@ DEBUG = True
 
 # SESSION
 # ------------------------------------------------------------------------------
-CONNECTIONS["default"]["HOST"] = "TEST_HOST"
-CONNECTIONS["default"]["PORT"] = "TEST_PORT"
-
-CONNECTIONS["default"]["SENDER"] = "SENDER_ID"
-CONNECTIONS["default"]["TARGET"] = "TARGET_ID"
-
-CONNECTIONS["default"]["USERNAME"] = "TEST_USER"
-CONNECTIONS["default"]["PASSWORD"] = "TEST_PASSWORD"
+CONNECTIONS["default"].update(
+    {
+        "HOST": "TEST_HOST",
+        "PORT": "TEST_PORT",
+        "SENDER": "SENDER_ID",
+        "TARGET": "TARGET_ID",
+        "USERNAME": "TEST_USER",
+        "PASSWORD": "TEST_PASSWORD",
+    }
+)
 
 # REPEATING GROUPS
 # Get protocol Type so that we can configure repeating groups  on a per-protocol basis
@@ -21,11 +21,10 @@ import logging
 import os
 import sys
 import signal
+from concurrent.futures import ThreadPoolExecutor
 
 from wtfix.conf import settings
 from wtfix.core.exceptions import ImproperlyConfigured
-from wtfix.pipeline import BasePipeline
-from wtfix.protocol.contextlib import connection_manager
 
 logger = settings.logger
 
@@ -43,20 +42,22 @@ parser.add_argument(
     help="reset sequence numbers and start a new session",
 )
 
-_shutting_down = asyncio.Event()
+_shutting_down = False
 
 
 async def graceful_shutdown(pipeline, sig_name=None, error=None):
+    global _shutting_down
+
     if pipeline.stopping_event.is_set():
         # Nothing to do
         return
 
-    if _shutting_down.is_set():
+    if _shutting_down:
         # Only try to shut down once
         logger.warning(f"Shutdown already in progress! Ignoring signal '{sig_name}'.")
         return
 
-    _shutting_down.set()
+    _shutting_down = True
 
     if sig_name is not None:
         logger.info(f"Received signal {sig_name}! Initiating graceful shutdown...")
@@ -66,13 +67,22 @@ async def graceful_shutdown(pipeline, sig_name=None, error=None):
     await pipeline.stop(error=error)
 
 
-async def main():
-    logging.basicConfig(
-        level=settings.LOGGING_LEVEL,
-        format="%(asctime)s - %(threadName)s - %(module)s - %(levelname)s - %(message)s",
-    )
+async def main(args):
+    # Only load the FIX engine once the command line arguments have been validated.
+    from wtfix.pipeline import BasePipeline
+    from wtfix.protocol.contextlib import connection_manager
+
+    if not logging.getLogger().hasHandlers():
+        # Don't reconfigure logging if the hosting process has already done so.
+        logging.basicConfig(
+            level=settings.LOGGING_LEVEL,
+            format="{asctime} - {module} - {levelname} - {message}",
+            style="{",
+        )
+
+        # The client runs in a single thread: don't look up thread information for every log record.
+        logging.logThreads = False
 
-    args = parser.parse_args()
     exit_code = os.EX_OK
 
     with connection_manager(args.connection) as conn:
@@ -84,12 +94,21 @@ async def main():
             # Graceful shutdown on termination signals.
             # See: https://docs.python.org/3.7/library/asyncio-eventloop.html#set-signal-handlers-for-sigint-and-sigterm
             loop = asyncio.get_running_loop()
-            for sig_name in {"SIGINT", "SIGTERM"}:
+
+            # The apps are all async, so the default executor is only used for resolving the server's address when
+            # connecting: don't let it grow to the default min(32, os.cpu_count() + 4) threads.
+            loop.set_default_executor(
+                ThreadPoolExecutor(max_workers=1, thread_name_prefix="wtfix-io")
+            )
+
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                # Pass the signal name as an argument: a closure over the loop variable would bind late.
                 loop.add_signal_handler(
-                    getattr(signal, sig_name),
-                    lambda: asyncio.create_task(
+                    sig,
+                    lambda sig_name: asyncio.create_task(
                         graceful_shutdown(fix_pipeline, sig_name=sig_name)
                     ),
+                    sig.name,
                 )
 
             await fix_pipeline.start()
@@ -99,28 +118,26 @@ async def main():
             # monitors like Supervisor do not attempt a restart immediately.
             await graceful_shutdown(fix_pipeline, error=e)
 
-        except KeyboardInterrupt:
-            logger.info("Received keyboard interrupt! Initiating shutdown...")
-            await graceful_shutdown(fix_pipeline)
-
         except Exception as e:
             await graceful_shutdown(fix_pipeline, error=e)
             exit_code = os.EX_UNAVAILABLE  # Abnormal termination
 
         finally:
             # Report tasks that are still running after shutdown.
+            current_task = asyncio.current_task()
             tasks = [
                 task
                 for task in asyncio.all_tasks()
-                if task is not asyncio.current_task() and not task.cancelled()
+                if task is not current_task and not task.cancelled()
             ]
 
             if tasks:
-                task_output = "\n".join(str(task) for task in tasks)
-                logger.warning(
-                    f"There are still {len(tasks)} tasks running that have not been cancelled! Cancelling them now...\n"
-                    f"{task_output}."
-                )
+                if logger.isEnabledFor(logging.WARNING):
+                    task_output = "\n".join(str(task) for task in tasks)
+                    logger.warning(
+                        f"There are still {len(tasks)} tasks running that have not been cancelled! "
+                        f"Cancelling them now...\n{task_output}."
+                    )
 
                 for task in tasks:
                     task.cancel()
@@ -129,4 +146,16 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Parse arguments before starting the event loop so that '--help' and usage errors return immediately.
+    args = parser.parse_args()
+
+    try:
+        import uvloop
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        # uvloop is not available on all platforms (e.g. Windows): fall back to the default asyncio event loop.
+        pass
+
+    # Make sure that asyncio's debug mode, with its per-callback timing checks, is never enabled in production.
+    asyncio.run(main(args), debug=False)
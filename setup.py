@@ -1,4 +1,4 @@
-from setuptools import setup, find_packages
+from setuptools import setup
 from os import path
 
 here = path.abspath(path.dirname(__file__))
@@ -26,13 +26,33 @@ setup(
         "Intended Audience :: Financial and Insurance Industry",
     ],
     keywords="FIX financial information exchange",
-    packages=find_packages(exclude=["contrib", "docs", "tests"]),
+    # Keep in sync with 'find_packages(exclude=["contrib", "docs", "tests"])' when adding new packages.
+    packages=[
+        "config",
+        "config.settings",
+        "wtfix",
+        "wtfix.apps",
+        "wtfix.apps.api",
+        "wtfix.apps.api.tests",
+        "wtfix.apps.tests",
+        "wtfix.conf",
+        "wtfix.core",
+        "wtfix.core.tests",
+        "wtfix.message",
+        "wtfix.message.tests",
+        "wtfix.protocol",
+        "wtfix.protocol.fix",
+        "wtfix.protocol.fix._44",
+        "wtfix.protocol.tests",
+        "wtfix.tests",
+    ],
     install_requires=[
         "python-dotenv>=0.10.3",
-        "flask-restful>=0.3.7",
-        "requests>=2.22",
-        "gunicorn>=19.9",
-        "aioredis>=1.3",
+        "fastapi>=0.100",
+        "python-multipart>=0.0.6",
+        "uvicorn[standard]>=0.22",
+        "redis[hiredis]>=5.0.1,<6",
+        "uvloop>=0.14; sys_platform != 'win32'",
     ],
     python_requires=">=3.8",
     project_urls={
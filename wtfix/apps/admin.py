@@ -16,19 +16,20 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import asyncio
-import collections
+import itertools
+import logging
+import time
 import uuid
-from datetime import datetime, timedelta
+from datetime import datetime
 from enum import Enum, auto
-from typing import Callable, List
+from typing import Callable, Sequence
 
 from wtfix.apps.base import MessageTypeHandlerApp, on
 from wtfix.apps.sessions import ClientSessionApp
 from wtfix.apps.store import MessageStoreApp
 from wtfix.conf import settings
-from wtfix.core.exceptions import TagNotFound, StopMessageProcessing, SessionError
+from wtfix.core.exceptions import StopMessageProcessing, SessionError
 from wtfix.message import admin
-from wtfix.core import utils
 from wtfix.message.message import FIXMessage
 from wtfix.pipeline import BasePipeline
 from wtfix.protocol.contextlib import connection
@@ -37,14 +38,13 @@ logger = settings.logger
 
 
 class HeartbeatTimers(Enum):
-    """Send / receive timers used by the heartbeat monitor"""
+    """
+    Send / receive timers used by the heartbeat monitor.
+    """
 
     SEND = auto()
     RECEIVE = auto()
 
-    def __init__(self, *args, **kwargs):
-        self.timestamp = None
-
 
 class HeartbeatApp(MessageTypeHandlerApp):
     """
@@ -56,7 +56,19 @@ class HeartbeatApp(MessageTypeHandlerApp):
     def __init__(self, pipeline: BasePipeline, *args, **kwargs):
         super().__init__(pipeline, *args, **kwargs)
 
+        # Default heartbeat interval, until one is agreed with the server during logon.
+        self._heartbeat_interval = self.pipeline.settings.HEARTBEAT_INT
+
         self._test_request_id = None  # A waiting TestRequest message for which no response has been received.
+        # Number the TestReqIDs with a counter, prefixed with a random token that is generated once per instance
+        # so that the IDs are not repeated after a reconnect or restart.
+        self._test_request_id_prefix = uuid.uuid4().hex[:8]
+        self._test_request_ids = itertools.count(1)
+
+        # Timestamps are recorded using time.monotonic(), which is cheaper to call than datetime.utcnow() and is not
+        # affected by system clock adjustments.
+        self._send_timestamp = None
+        self._receive_timestamp = None
 
         self._received_monitor_task = None
         self._sent_monitor_task = None
@@ -66,16 +78,11 @@ class HeartbeatApp(MessageTypeHandlerApp):
     def heartbeat_interval(self) -> int:
         """
         The heartbeat interval is supposed to be agreed between the sender and target as part of the logon
-        process (which is why we do not accept it as a parameter or set it in the constructor).
+        process (which is why we do not accept it as a parameter).
 
-        Use a default value here as fallback.
+        Uses the HEARTBEAT_INT setting as fallback until logon has been completed.
         """
-        try:
-            return self._heartbeat_interval
-        except AttributeError:
-            self._heartbeat_interval = self.pipeline.settings.HEARTBEAT_INT
-
-            return self._heartbeat_interval
+        return self._heartbeat_interval
 
     @heartbeat_interval.setter
     def heartbeat_interval(self, value: int):
@@ -94,11 +101,18 @@ class HeartbeatApp(MessageTypeHandlerApp):
         :timer: The timer being checked (sent / received)
         :return: The number of seconds before the next check is due to occur.
         """
-        if timer.timestamp is None:
-            timer.timestamp = datetime.utcnow()
+        now = time.monotonic()
+
+        if timer is HeartbeatTimers.SEND:
+            if self._send_timestamp is None:
+                self._send_timestamp = now
+            timestamp = self._send_timestamp
+        else:
+            if self._receive_timestamp is None:
+                self._receive_timestamp = now
+            timestamp = self._receive_timestamp
 
-        elapsed = (datetime.utcnow() - timer.timestamp).total_seconds()
-        return max(self.heartbeat_interval - elapsed, 0)
+        return max(self.heartbeat_interval - (now - timestamp), 0)
 
     def is_waiting(self) -> bool:
         """
@@ -199,14 +213,14 @@ class HeartbeatApp(MessageTypeHandlerApp):
         Checks if the server is responding to TestRequest messages.
         """
 
-        self._test_request_id = uuid.uuid4().hex
+        self._test_request_id = (
+            f"{self._test_request_id_prefix}-{next(self._test_request_ids)}"
+        )
         logger.warning(
             f"{self.name}: Heartbeat exceeded, sending test request '{self._test_request_id}'..."
         )
         # Don't need to block while request is sent
-        asyncio.create_task(
-            self.send(admin.TestRequestMessage(utils.encode(self._test_request_id)))
-        )
+        asyncio.create_task(self.send(admin.TestRequestMessage(self._test_request_id)))
 
         # Sleep while we wait for a response on the test request
         await asyncio.sleep(self.test_request_response_delay)
@@ -221,7 +235,7 @@ class HeartbeatApp(MessageTypeHandlerApp):
         logger.debug(f"{self.name}: Pipeline idle, sending heartbeat...")
 
         # Update timer immediately to avoid flooding the target with heartbeats.
-        HeartbeatTimers.SEND.timestamp = datetime.utcnow()
+        self._send_timestamp = time.monotonic()
 
         asyncio.create_task(
             self.send(admin.HeartbeatMessage())
@@ -246,9 +260,10 @@ class HeartbeatApp(MessageTypeHandlerApp):
 
         :param message: The TestRequest message. Should contain a TestReqID.
         """
-        logger.debug(
-            f"{self.name}: Sending heartbeat in response to request {message.TestReqID}."
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"{self.name}: Sending heartbeat in response to request {message.TestReqID}."
+            )
         # Don't need to block while heartbeat is sent
         asyncio.create_task(self.send(admin.HeartbeatMessage(str(message.TestReqID))))
 
@@ -261,13 +276,18 @@ class HeartbeatApp(MessageTypeHandlerApp):
         :param message: The Heartbeat message that was received in response to our TestRequest. The
         TestReqID for the TestRequest and Heartbeat messages should match for this to be a valid response.
         """
-        try:
-            if message.TestReqID == self._test_request_id:
-                # Response received - reset
-                self._test_request_id = None
-        except TagNotFound:
+        if self._test_request_id is None:
+            # Not waiting for a TestRequest response - nothing more to do
+            return message
+
+        if connection.protocol.Tag.TestReqID not in message:
             # Random heartbeat message received - nothing more to do
-            pass
+            return message
+
+        # Compare the plain str values directly, instead of going through Field's operator overloading.
+        if message.TestReqID.value == self._test_request_id:
+            # Response received - reset
+            self._test_request_id = None
 
         return message
 
@@ -275,9 +295,8 @@ class HeartbeatApp(MessageTypeHandlerApp):
         """
         Update the send timer whenever any message is sent.
         """
-        HeartbeatTimers.SEND.timestamp = (
-            datetime.utcnow()
-        )  # Update timestamp on every message sent
+        # Update timestamp on every message sent
+        self._send_timestamp = time.monotonic()
 
         return await super().on_send(message)
 
@@ -285,9 +304,8 @@ class HeartbeatApp(MessageTypeHandlerApp):
         """
         Update the receive timer whenever any message is received.
         """
-        HeartbeatTimers.RECEIVE.timestamp = (
-            datetime.utcnow()
-        )  # Update timestamp on every message received
+        # Update timestamp on every message received
+        self._receive_timestamp = time.monotonic()
 
         return await super().on_receive(message)
 
@@ -357,20 +375,18 @@ class AuthenticationApp(MessageTypeHandlerApp):
                 f"value {self.heartbeat_int}."
             )
 
-        try:
-            test_mode = bool(message.TestMessageIndicator)
-        except TagNotFound:
-            test_mode = False
+        test_mode = connection.protocol.Tag.TestMessageIndicator in message and bool(
+            message.TestMessageIndicator
+        )
 
         if test_mode != self.test_mode:
             raise SessionError(
                 f"{self.name}: Test mode confirmation '{test_mode}' does not match logon value {self.test_mode}."
             )
 
-        try:
-            reset_seq_nums = bool(message.ResetSeqNumFlag)
-        except TagNotFound:
-            reset_seq_nums = False
+        reset_seq_nums = connection.protocol.Tag.ResetSeqNumFlag in message and bool(
+            message.ResetSeqNumFlag
+        )
 
         if reset_seq_nums != self.reset_seq_nums:
             raise SessionError(
@@ -392,31 +408,29 @@ class AuthenticationApp(MessageTypeHandlerApp):
 
         return message
 
-    async def on_receive(self, message: FIXMessage) -> FIXMessage:
+    async def _wait_for_logon(self, message: FIXMessage):
+        """
+        Block non-authentication messages until we've logged in successfully.
 
-        # Block non-authentication messages until we've logged in successfully
-        if (
-            not self.logged_in_event.is_set()
-            and message.type not in SeqNumManagerApp.ADMIN_MESSAGES
-        ):
+        :param message: The message that is being received or sent before logon has been completed.
+        """
+        if message.type not in SeqNumManagerApp.ADMIN_MESSAGES:
             logger.warning(
                 f"{self.name}: Blocking message until logon is completed: {message}."
             )
             await self.logged_in_event.wait()
 
+    async def on_receive(self, message: FIXMessage) -> FIXMessage:
+        # Only check the message type while logon is still in progress.
+        if not self.logged_in_event.is_set():
+            await self._wait_for_logon(message)
+
         return await super().on_receive(message)
 
     async def on_send(self, message: FIXMessage) -> FIXMessage:
-
-        # Block non-authentication messages until we've logged in successfully
-        if (
-            not self.logged_in_event.is_set()
-            and message.type not in SeqNumManagerApp.ADMIN_MESSAGES
-        ):
-            logger.warning(
-                f"{self.name}: Blocking message until logon is completed: {message}."
-            )
-            await self.logged_in_event.wait()
+        # Only check the message type while logon is still in progress.
+        if not self.logged_in_event.is_set():
+            await self._wait_for_logon(message)
 
         return message
 
@@ -470,27 +484,36 @@ class SeqNumManagerApp(MessageTypeHandlerApp):
 
     name = "seq_num_manager"
 
-    ADMIN_MESSAGES = [
-        connection.protocol.MsgType.Logon,
-        connection.protocol.MsgType.Logout,
-        connection.protocol.MsgType.ResendRequest,
-        connection.protocol.MsgType.Heartbeat,
-        connection.protocol.MsgType.TestRequest,
-        connection.protocol.MsgType.SequenceReset,
-    ]
+    ADMIN_MESSAGES = frozenset(
+        {
+            connection.protocol.MsgType.Logon,
+            connection.protocol.MsgType.Logout,
+            connection.protocol.MsgType.ResendRequest,
+            connection.protocol.MsgType.Heartbeat,
+            connection.protocol.MsgType.TestRequest,
+            connection.protocol.MsgType.SequenceReset,
+        }
+    )
 
     # How long to wait (in seconds) for resend requests from target before sending our own resend requests.
     RESEND_WAIT_TIME = 5
 
     def __init__(self, pipeline: BasePipeline, *args, **kwargs):
 
-        self.startup_time = (
-            None  # Needed to check if we should wait for resend requests from target
-        )
-        self._send_seq_num = 0
-        self._receive_seq_num = 0
+        # Needed to check if we should wait for resend requests from target. Uses the monotonic clock, so that
+        # the wait is not affected by changes to the system time.
+        self.startup_time = None
+        # Plain int attributes: these are read and updated for every message sent and received.
+        self.send_seq_num = 0
+        self.receive_seq_num = 0
+
+        # Messages received out of order while a gap fill is in progress, keyed by sequence number.
+        self.receive_buffer = {}
+        # Replayed messages pass through on_receive again: used to stop them from starting a nested replay.
+        self._replaying = False
 
-        self.receive_buffer = collections.deque()
+        self._session_app = None
+        self._message_store_app = None
 
         self.resend_request_handled_event = asyncio.Event()
         self.resend_request_handled_event.set()  # Detect if a resend request has been responded to
@@ -501,26 +524,17 @@ class SeqNumManagerApp(MessageTypeHandlerApp):
 
         super().__init__(pipeline, *args, **kwargs)
 
-    @property
-    def send_seq_num(self) -> int:
-        return self._send_seq_num
-
-    @send_seq_num.setter
-    def send_seq_num(self, value: int):
-        self._send_seq_num = int(value)  # Make sure we received an int
-
-    @property
-    def receive_seq_num(self) -> int:
-        return self._receive_seq_num
-
-    @receive_seq_num.setter
-    def receive_seq_num(self, value: int):
-        self._receive_seq_num = int(value)  # Make sure we received an int
-
     @property
     def expected_seq_num(self) -> int:
         return self.receive_seq_num + 1
 
+    async def initialize(self, *args, **kwargs):
+        await super().initialize(*args, **kwargs)
+
+        # Micro-optimization: store local references to the apps that are needed for gap fills and resends
+        self._session_app = self.pipeline.apps[ClientSessionApp.name]
+        self._message_store_app = self.pipeline.apps[MessageStoreApp.name]
+
     async def start(self, *args, **kwargs):
         await super().start(*args, **kwargs)
 
@@ -528,89 +542,94 @@ class SeqNumManagerApp(MessageTypeHandlerApp):
         if client_session.is_resumed:
             message_store = self.pipeline.apps[MessageStoreApp.name].store
 
-            sent_seq_nums = await message_store.filter(
-                session_id=client_session.session_id, originator=client_session.sender
-            )  # Get sequence number of last message sent
-
-            received_seq_nums = await message_store.filter(
-                session_id=client_session.session_id, originator=client_session.target
-            )  # Get sequence number of last message received.
-
-            try:
-                self.send_seq_num = sent_seq_nums[-1]
-            except IndexError:
-                # No messages sent yet
-                self.send_seq_num = 0
-
-            try:
-                self.receive_seq_num = received_seq_nums[-1]
-            except IndexError:
-                # No messages received yet
-                self.receive_seq_num = 0
+            # Get sequence numbers of last messages sent and received. The lookups are independent, so
+            # wait for both of them at the same time.
+            self.send_seq_num, self.receive_seq_num = await asyncio.gather(
+                message_store.last_seq_num(
+                    client_session.session_id, client_session.sender
+                ),
+                message_store.last_seq_num(
+                    client_session.session_id, client_session.target
+                ),
+            )
 
         else:
             self.send_seq_num = 0
             self.receive_seq_num = 0
 
-        self.startup_time = datetime.utcnow()
+        self.startup_time = time.monotonic()
 
-    async def _check_sequence_number(self, message: FIXMessage) -> FIXMessage:
-
-        if int(message.seq_num) < self.expected_seq_num:
-            self._handle_sequence_number_too_low(message)
-
-        elif int(message.seq_num) > self.expected_seq_num:
-            message = await self._handle_sequence_number_too_high(message)
+    async def _replay_buffered_messages(self):
+        """
+        Replay the messages that were buffered during a gap fill, once the missing messages have all been received.
 
-        else:
-            # Message received in correct order.
-            if message.type == connection.protocol.MsgType.SequenceReset:
-                # Special handling for SequenceReset admin message
-                message = self._handle_sequence_reset(message)
-            else:
-                # Update counter as early as possible
-                self.receive_seq_num = message.seq_num
+        The gap has been filled as soon as the next message expected is in the buffer. Buffered messages are
+        replayed in sequence number order for as long as the next expected message is available.
+        """
+        if self._replaying or self.expected_seq_num not in self.receive_buffer:
+            # Still waiting for missing messages, or already busy replaying them
+            return
 
-            if len(self.receive_buffer) > 0:
-                # See if the gap has been filled and we can replay buffered messages.
-                await self._replay_buffered_messages()
+        # We've just received the missing sequence numbers. Process and clear any messages that
+        # were buffered since gap fill started.
+        logger.info(
+            f"{self.name}: Gap fill completed, processing {len(self.receive_buffer)} queued "
+            f"messages (#{min(self.receive_buffer)} - #{max(self.receive_buffer)})."
+        )
 
-        return message
+        log_messages = logger.isEnabledFor(logging.DEBUG)
+        resubmitted = skipped = 0
 
-    async def _replay_buffered_messages(self):
+        self._replaying = True
         try:
-            if self.receive_buffer[0].seq_num == self.expected_seq_num:
-                # We've just received the missing sequence numbers. Process and clear any messages that
-                # were buffered since gap fill started.
-                logger.info(
-                    f"{self.name}: Gap fill completed, processing {len(self.receive_buffer)} queued "
-                    f"messages (#{self.receive_buffer[0].seq_num} - #{self.receive_buffer[-1].seq_num})."
-                )
-
-                while len(self.receive_buffer) > 0:
-                    resubmit_message = self.receive_buffer.popleft()
-                    if resubmit_message.type in SeqNumManagerApp.ADMIN_MESSAGES:
-                        # Don't re-submit admin messages
-                        logger.info(
+            while self.expected_seq_num in self.receive_buffer:
+                resubmit_message = self.receive_buffer.pop(self.expected_seq_num)
+                if resubmit_message.type in SeqNumManagerApp.ADMIN_MESSAGES:
+                    # Don't re-submit admin messages
+                    if log_messages:
+                        logger.debug(
                             f"{self.name}: Skipping queued admin message #{resubmit_message.seq_num} "
                             f"({resubmit_message})."
                         )
-                        self.receive_seq_num += 1
-                        continue
+                    self.receive_seq_num += 1
+                    skipped += 1
+                    continue
 
-                    logger.info(
+                if log_messages:
+                    # Avoid formatting every queued message if the log record would be discarded.
+                    logger.debug(
                         f"{self.name}: Resubmitting queued message #{resubmit_message.seq_num} "
                         f"({resubmit_message})."
                     )
 
-                    await asyncio.wait_for(
-                        self.pipeline.receive(bytes(resubmit_message)),
-                        None,  # Disable timeout so that we rely entirely on the pipeline to handle message processing.
-                    )
+                # Skip the wire and parser apps: the message has already been parsed. Start at the message
+                # store, which needs to record the message again after it was deleted when the gap was detected.
+                await asyncio.wait_for(
+                    self.pipeline.reinject(resubmit_message, MessageStoreApp.name),
+                    None,  # Disable timeout so that we rely entirely on the pipeline to handle message processing.
+                )
+                resubmitted += 1
+        finally:
+            self._replaying = False
 
-        except IndexError:
-            # Buffer is empty - continue
-            pass
+        logger.info(
+            f"{self.name}: Resubmitted {resubmitted} queued message(s), skipped {skipped} admin message(s)."
+        )
+
+        if len(self.receive_buffer) > 0:
+            # The buffer contained more than one gap: request the messages that are still missing before the
+            # next queued message, otherwise the remaining buffered messages will never be replayed. This is done
+            # once the replay loop has finished, so that nested calls for replayed messages don't request it again.
+            missing_seq_nums = range(self.expected_seq_num, min(self.receive_buffer))
+
+            logger.warning(
+                f"{self.name}: Client still missing {len(missing_seq_nums)} message(s). Sequence number(s): "
+                f"#{missing_seq_nums[0]} - #{missing_seq_nums[-1]}."
+            )
+
+            asyncio.create_task(
+                self._send_resend_request(missing_seq_nums)
+            )  # Separate task - don't block while waiting for send!
 
     def _handle_sequence_number_too_low(self, message: FIXMessage):
         """
@@ -621,21 +640,24 @@ class SeqNumManagerApp(MessageTypeHandlerApp):
         :param message: The FIX message to check
         :raises: SessionError if a non-duplicate message is received with a lower than expected sequence number.
         """
-        error_msg = f"Unexpected message sequence number '{message.seq_num}'. Expected '{self.expected_seq_num}'."
-        try:
-            if bool(message.PossDupFlag) is True:
-                # Duplicate that must already have been processed - ignore
-                raise StopMessageProcessing(
-                    f"{self.name}: Ignoring duplicate with lower than "
-                    f"expected sequence number: {message}."
-                )
-
-        except TagNotFound:
-            raise SessionError(error_msg)
+        if (
+            connection.protocol.Tag.PossDupFlag in message
+            and bool(message.PossDupFlag) is True
+        ):
+            # Duplicate that must already have been processed - ignore
+            raise StopMessageProcessing(
+                f"{self.name}: Ignoring duplicate with lower than "
+                f"expected sequence number: {message}."
+            )
 
-        raise SessionError(error_msg)
+        raise SessionError(
+            f"Unexpected message sequence number '{message.seq_num}'. Expected '{self.expected_seq_num}'."
+        )
 
     async def _handle_sequence_number_too_high(self, message: FIXMessage) -> FIXMessage:
+        # Resolve the sequence numbers once: every message received during a gap fill ends up here.
+        seq_num = message.seq_num
+        expected_seq_num = self.expected_seq_num
 
         # We've missed some incoming messages
         if len(self.receive_buffer) == 0:
@@ -643,57 +665,54 @@ class SeqNumManagerApp(MessageTypeHandlerApp):
             # Start a new gap fill operation
             logger.warning(
                 f"{self.name}: Sequence number gap detected! Expected: "
-                f"{self.expected_seq_num}, received: {message.seq_num})"
+                f"{expected_seq_num}, received: {seq_num})"
             )
-            missing_seq_nums = [
-                seq_num for seq_num in range(self.expected_seq_num, message.seq_num)
-            ]
+            # Use a range instead of a list: gaps after a long disconnect can span many thousands of messages.
+            missing_seq_nums = range(expected_seq_num, seq_num)
 
             logger.warning(
                 f"{self.name}: Client missed {len(missing_seq_nums)} message(s). Sequence number(s): "
-                f"{missing_seq_nums}."
+                f"#{missing_seq_nums[0]} - #{missing_seq_nums[-1]}."
             )
 
-            # Start buffering out-of-sequence messages
-            self.receive_buffer.append(message)
-
             asyncio.create_task(
                 self._send_resend_request(missing_seq_nums)
             )  # Separate task - don't block while waiting for send!
 
-        else:
-            # Already busy processing gap fill, add to queue
-            self.receive_buffer.append(message)
+        # Start buffering out-of-sequence messages, or add to the queue if we are already busy processing a gap
+        # fill. Keep the first copy of any duplicates that are received.
+        self.receive_buffer.setdefault(seq_num, message)
 
         # Delete messages that were received out of order from the message store
-        session_id = self.pipeline.apps[ClientSessionApp.name].session_id
-        await self.pipeline.apps[MessageStoreApp.name].store.delete(
-            session_id, message.SenderCompID, message.seq_num
+        await self._message_store_app.store.delete(
+            self._session_app.session_id, message.SenderCompID, seq_num
         )
 
         if message.type in SeqNumManagerApp.ADMIN_MESSAGES:
             # Always propagate admin messages to the rest of the pipeline apps, even if received out of order
-            f"Propagating admin message #{message.seq_num} while gap fill is in progress "
-            f"(waiting for #{self.expected_seq_num})..."
+            f"Propagating admin message #{seq_num} while gap fill is in progress "
+            f"(waiting for #{expected_seq_num})..."
             return message
 
         # ALL OTHER MESSAGE TYPES: don't propagate any further!
         raise StopMessageProcessing(
-            f"Queueing message #{message.seq_num} while gap fill is in progress "
-            f"(waiting for #{self.expected_seq_num})..."
+            f"Queueing message #{seq_num} while gap fill is in progress "
+            f"(waiting for #{expected_seq_num})..."
         )
 
-    async def _send_resend_request(self, missing_seq_nums: List[int]):
+    async def _send_resend_request(self, missing_seq_nums: Sequence[int]):
         # Wait for opportunity to send resend request. Must:
         #
         #   1.) Have waited for resend requests from the target; and
         #   2.) Not be busy handling a resend request from the target
 
         if not self.waited_for_resend_request_event.is_set():
-            wait_time = self.startup_time + timedelta(
-                seconds=SeqNumManagerApp.RESEND_WAIT_TIME
+            wait_time = max(
+                self.startup_time
+                + SeqNumManagerApp.RESEND_WAIT_TIME
+                - time.monotonic(),
+                0,
             )
-            wait_time = max(wait_time.timestamp() - datetime.utcnow().timestamp(), 0)
             logger.info(
                 f"{self.name}: Waiting {wait_time:0.2f}s for ResendRequests from target "
                 f"before doing gap fill..."
@@ -731,23 +750,27 @@ class SeqNumManagerApp(MessageTypeHandlerApp):
         )  # Admin messages are handled differently, need a place to buffer them
         next_seq_num = begin_seq_no
 
-        message_store = self.pipeline.apps[MessageStoreApp.name]
-        for seq_num in range(begin_seq_no, end_seq_no + 1):
-            resend_msg = await message_store.get_sent(
-                seq_num
-            )  # Retrieve the message from the MessageStore
+        # Retrieve all of the messages from the MessageStore at once, instead of one round trip per message.
+        resend_msgs = await self._message_store_app.get_sent_range(
+            begin_seq_no, end_seq_no
+        )
+
+        # Resolve loop invariants once: a resend can span thousands of messages.
+        admin_messages = SeqNumManagerApp.ADMIN_MESSAGES
+        # Collect the messages to be resent and submit them from a single task, in order, instead of scheduling
+        # a separate task for every message.
+        resends = []
 
-            if resend_msg.MsgType in SeqNumManagerApp.ADMIN_MESSAGES:
+        for resend_msg in resend_msgs:
+            if resend_msg.type in admin_messages:
                 # Admin message - continue: to see if there are more sequential ones after this one
                 admin_seq_nums.append(resend_msg.seq_num)
                 continue
 
             if len(admin_seq_nums) > 0:
                 # Admin messages were found, submit SequenceReset
-                asyncio.create_task(
-                    self.send(
-                        admin.SequenceResetMessage(next_seq_num, admin_seq_nums[-1] + 1)
-                    )
+                resends.append(
+                    admin.SequenceResetMessage(next_seq_num, admin_seq_nums[-1] + 1)
                 )
                 next_seq_num = admin_seq_nums[-1] + 1
                 admin_seq_nums.clear()
@@ -760,35 +783,46 @@ class SeqNumManagerApp(MessageTypeHandlerApp):
             resend_msg.PossDupFlag = "Y"
             resend_msg.OrigSendingTime = str(resend_msg.SendingTime)
 
-            asyncio.create_task(self.send(resend_msg))
+            resends.append(resend_msg)
             next_seq_num += 1
 
         else:
             # Handle situation where last message was itself an admin message
             if len(admin_seq_nums) > 0:
                 # Admin messages were found, submit SequenceReset
-                asyncio.create_task(
-                    self.send(
-                        admin.SequenceResetMessage(next_seq_num, admin_seq_nums[-1] + 1)
-                    )
+                resends.append(
+                    admin.SequenceResetMessage(next_seq_num, admin_seq_nums[-1] + 1)
                 )
                 admin_seq_nums.clear()
 
+        if resends:
+            asyncio.create_task(self._send_messages(resends))
+
         self.resend_request_handled_event.set()
 
         return message
 
+    async def _send_messages(self, messages: Sequence[FIXMessage]):
+        """
+        Send a batch of messages one after the other.
+
+        :param messages: The messages to send, in the order that they should be sent.
+        """
+        send = self.send
+        for message in messages:
+            await send(message)
+
     def _handle_sequence_reset(self, message: FIXMessage) -> FIXMessage:
+        new_seq_num = int(message.NewSeqNo)
+
         # Discard buffered messages with lower sequence numbers than SequenceReset
-        try:
-            while self.receive_buffer[0].seq_num < int(message.NewSeqNo):
-                self.receive_buffer.popleft()
-        except IndexError:
-            # Buffer empty, continue
-            pass
+        for seq_num in [
+            seq_num for seq_num in self.receive_buffer if seq_num < new_seq_num
+        ]:
+            del self.receive_buffer[seq_num]
 
         # Reset sequence number: increment receive_seq_num so that the correct sequence number is expected next.
-        self.receive_seq_num = int(message.NewSeqNo) - 1
+        self.receive_seq_num = new_seq_num - 1
 
         return message
 
@@ -796,13 +830,36 @@ class SeqNumManagerApp(MessageTypeHandlerApp):
         """
         Check the sequence number for every message received
         """
+        # Only look up the message type once: this is performed for every message received.
+        message_type = message.type
+
         # Special handling for ResendRequest admin message: should be responded to even if received out of order
-        if message.type == connection.protocol.MsgType.ResendRequest:
+        if message_type == connection.protocol.MsgType.ResendRequest:
             message = await self._handle_resend_request(
                 message
             )  # Handle resend request immediately.
 
-        message = await self._check_sequence_number(message)
+        seq_num = message.seq_num
+        expected_seq_num = self.expected_seq_num
+
+        if seq_num < expected_seq_num:
+            self._handle_sequence_number_too_low(message)
+
+        elif seq_num > expected_seq_num:
+            message = await self._handle_sequence_number_too_high(message)
+
+        else:
+            # Message received in correct order.
+            if message_type == connection.protocol.MsgType.SequenceReset:
+                # Special handling for SequenceReset admin message
+                message = self._handle_sequence_reset(message)
+            else:
+                # Update counter as early as possible
+                self.receive_seq_num = seq_num
+
+            if len(self.receive_buffer) > 0:
+                # See if the gap has been filled and we can replay buffered messages.
+                await self._replay_buffered_messages()
 
         return await super().on_receive(message)
 
@@ -810,10 +867,10 @@ class SeqNumManagerApp(MessageTypeHandlerApp):
         """
         Inject MsgSeqNum for every message to be sent, except duplicates.
         """
-        try:
-            is_duplicate = bool(message.PossDupFlag)
-        except TagNotFound:
-            is_duplicate = False
+        # Check for the tag first: raising TagNotFound for every non-duplicate message would be expensive.
+        is_duplicate = connection.protocol.Tag.PossDupFlag in message and bool(
+            message.PossDupFlag
+        )
 
         if not is_duplicate:
             # Set sequence number
@@ -14,13 +14,12 @@
 #
 # You should have received a copy of the GNU Lesser General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
 import asyncio
-import uuid
-from multiprocessing import Process
+import contextlib
 
-import requests
-from flask import Flask, request
-from flask_restful import Api, Resource, reqparse
+import uvicorn
+from fastapi import FastAPI, Form
 
 from wtfix.apps.api.utils import JsonResultResponse
 from wtfix.apps.base import BaseApp
@@ -30,71 +29,31 @@ from wtfix.core import decoders
 logger = settings.logger
 
 
-class Status(Resource):
-    def __init__(self, app):
-        self.app = app
-
-    def get(self):
-        return JsonResultResponse(True, "WTFIX REST API is up and running!", {})
-
-
-class Send(Resource):
+class EmbeddedServer(uvicorn.Server):
     """
-    API endpoint for injecting messages into the pipeline.
+    uvicorn server that runs on the pipeline's event loop, and leaves signal handling to the process that hosts
+    the pipeline (e.g. 'run_client.py').
     """
 
-    def __init__(self, app):
-        self.app = app
-
-        self.parser = reqparse.RequestParser()
-        self.parser.add_argument("message", required=True)
+    def __init__(self, config: uvicorn.Config):
+        super().__init__(config)
 
-    def post(self):
-        """
-        Endpoint for sending a FIX message.
+        self.started_event = asyncio.Event()
 
-        'message' should be a FIXMessage that was previously JSON-encoded with encoders.to_json(message).
+    async def startup(self, *args, **kwargs):
+        await super().startup(*args, **kwargs)
 
-        """
-        args = self.parser.parse_args()
-        message = decoders.from_json(args["message"])
+        if self.started:
+            # Notify anyone waiting for the server to start listening for requests.
+            self.started_event.set()
 
-        asyncio.create_task(self.app.send(message))
+    def install_signal_handlers(self):
+        # uvicorn < 0.29
+        pass
 
-        return JsonResultResponse(
-            True,
-            "Successfully added message to pipeline!",
-            {"message": args["message"]},
-        )
-
-
-class Shutdown(Resource):
-    """
-    Shut down the Flask server.
-    """
-
-    def __init__(self, app):
-        self.app = app
-
-        self.parser = reqparse.RequestParser()
-        self.parser.add_argument("token", required=True)
-
-    def post(self):
-        args = self.parser.parse_args()
-
-        if args["token"] != self.app.secret_key:
-            return JsonResultResponse(
-                False,
-                "Shutdown request could not be processed!",
-                {"reason": f"Invalid token '{args['token']}'."},
-            )
-
-        func = request.environ.get("werkzeug.server.shutdown")
-        if func is None:
-            raise RuntimeError("Not running with the Werkzeug Server")
-        func()
-
-        return JsonResultResponse(True, "Server shutdown initiated!", {})
+    @contextlib.contextmanager
+    def capture_signals(self):
+        yield
 
 
 class RESTfulServiceApp(BaseApp):
@@ -106,60 +65,102 @@ class RESTfulServiceApp(BaseApp):
 
     name = "rest_api_service"
 
-    def __init__(self, pipeline, *args, **kwargs):
+    def __init__(self, pipeline, *args, host=None, port=None, **kwargs):
         super().__init__(pipeline, *args, **kwargs)
 
-        self._flask_app = None
-        self._flask_process = None
-        self.secret_key = (
-            uuid.uuid4().hex
-        )  # Secret key used internally by restricted APIs that should only be callable by this app itself.
-
-    @property
-    def flask_app(self):
-        if self._flask_app is None:
-
-            if settings.DEBUG is True:
-                # We need to start our own Flask application
-                logger.info(
-                    f"{self.name}: Starting Flask development server at http://127.0.0.1:5000"
-                )
+        if host is None:
+            host = settings.REST_API_HOST
 
-                self._flask_app = Flask(__name__)
-                self._flask_process = Process(
-                    target=self._run_flask_dev_server, args=(self._flask_app,)
-                )
-                self._flask_process.start()
-            else:
-                # Must be running as a WSGI application
-                from config.wsgi import app
+        if port is None:
+            port = settings.REST_API_PORT
 
-                self._flask_app = app
+        self.host = host
+        self.port = port
 
-        return self._flask_app
+        self.api = FastAPI(title="WTFIX")
+        self._server = None
+        self._server_task = None
 
     async def initialize(self, *args, **kwargs):
         await super().initialize(*args, **kwargs)
 
-        api = Api(self.flask_app)
-        api.add_resource(Status, "/", resource_class_args=[self])
-        api.add_resource(Send, "/send", resource_class_args=[self])
-        api.add_resource(Shutdown, "/shutdown", resource_class_args=[self])
+        self.api.add_api_route("/", self.get_status, methods=["GET"])
+        self.api.add_api_route("/send", self.post_send, methods=["POST"])
 
-    def _run_flask_dev_server(self, flask_app):
-        # Start Flask in a separate thread
-        flask_app.run(
-            debug=False
-        )  # debug=False: disable automatic restarting of the Flask server
+    async def start(self, *args, **kwargs):
+        await super().start(*args, **kwargs)
 
-    async def stop(self, *args, **kwargs):
-        result = requests.post(
-            "http://127.0.0.1:5000/shutdown", data={"token": self.secret_key}
+        logger.info(
+            f"{self.name}: Starting API server at http://{self.host}:{self.port}"
+        )
+
+        # Serve the API on the same event loop as the pipeline, so that requests can interact with the apps directly.
+        self._server = EmbeddedServer(
+            uvicorn.Config(
+                self.api,
+                host=self.host,
+                port=self.port,
+                lifespan="off",
+                log_config=None,  # Don't replace the logging configuration of the hosting process.
+            )
+        )
+        self._server_task = asyncio.create_task(
+            self._serve(), name=f"Task-{self.name}:server"
+        )
+
+        # Don't report the app as started until the server is listening for requests.
+        started_task = asyncio.create_task(self._server.started_event.wait())
+        await asyncio.wait(
+            {started_task, self._server_task}, return_when=asyncio.FIRST_COMPLETED
         )
 
-        if self._flask_process is not None:
-            self._flask_process.kill()
+        if not started_task.done():
+            started_task.cancel()
+            server_task, self._server_task = self._server_task, None
+            # Raises the reason why the server could not be started.
+            server_task.result()
+            raise RuntimeError(
+                f"{self.name}: API server stopped before it could be started."
+            )
+
+    async def _serve(self):
+        """
+        Run the server until it is shut down.
+
+        :raises: RuntimeError if the server could not be started (e.g. because the port is already in use).
+        """
+        try:
+            await self._server.serve()
+        except (SystemExit, OSError) as e:
+            # uvicorn calls sys.exit() if it cannot bind to the socket: don't let that terminate the whole process.
+            raise RuntimeError(
+                f"{self.name}: Could not start API server at http://{self.host}:{self.port}."
+            ) from e
+
+    async def stop(self, *args, **kwargs):
+        if self._server_task is not None:
+            logger.info(f"{self.name}: Shutting down API server...")
+
+            self._server.should_exit = True
+            await self._server_task
 
         await super().stop(*args, **kwargs)
 
-        return result
+    async def get_status(self):
+        return JsonResultResponse(True, "WTFIX REST API is up and running!", {})
+
+    async def post_send(self, message: str = Form(...)):
+        """
+        Endpoint for sending a FIX message.
+
+        'message' should be a FIXMessage that was previously JSON-encoded with encoders.to_json(message).
+        """
+        asyncio.create_task(
+            self.send(decoders.from_json(message))
+        )  # Pass message on to pipeline
+
+        return JsonResultResponse(
+            True,
+            "Successfully added message to pipeline!",
+            {"message": message},
+        )
@@ -1,7 +1,7 @@
 from unittest.mock import MagicMock
 
+import httpx
 import pytest
-from flask import Flask
 
 from wtfix.apps.api.rest import RESTfulServiceApp
 from wtfix.pipeline import BasePipeline
@@ -12,14 +12,14 @@ async def api_app():
     pipeline_mock = MagicMock(BasePipeline)
     api_app = RESTfulServiceApp(pipeline_mock)
 
-    api_app._flask_app = Flask(
-        __name__
-    )  # Need full Flask app to initialize RESTful APIs :(
-    api_app._flask_app.config["TESTING"] = True
-
     await api_app.initialize()
-    api_app._flask_app = (
-        api_app.flask_app.test_client()
-    )  # Switch to test client after initialization
 
     return api_app
+
+
+@pytest.fixture
+async def api_client(api_app):
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=api_app.api), base_url="http://testserver"
+    ) as client:
+        yield client
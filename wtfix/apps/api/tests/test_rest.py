@@ -1,32 +1,39 @@
-import json
+import asyncio
+import socket
+from unittest.mock import MagicMock
 
+import httpx
 import pytest
 
+from wtfix.apps.api.rest import RESTfulServiceApp
+from wtfix.conf import settings
 from wtfix.core import decoders, encoders
 from wtfix.message import admin
+from wtfix.pipeline import BasePipeline
 
 
 class TestRESTfulServiceApp:
-    def test_get_status(self, api_app):
-        response = api_app.flask_app.get("/")
+    @pytest.mark.asyncio
+    async def test_get_status(self, api_client):
+        response = await api_client.get("/")
 
         assert response.status_code == 200
 
-        result = json.loads(response.data)
+        result = response.json()
         assert result["success"] is True
         assert result["message"] == "WTFIX REST API is up and running!"
 
-    @pytest.mark.skip("Need to figure out how to update test to run in event loop")
-    def test_get_send(self, api_app):
+    @pytest.mark.asyncio
+    async def test_post_send(self, api_app, api_client):
 
         msg = admin.TestRequestMessage("TEST123")
         encoded_msg = encoders.to_json(msg)
 
-        response = api_app.flask_app.post("/send", data={"message": encoded_msg})
+        response = await api_client.post("/send", data={"message": encoded_msg})
 
         assert response.status_code == 200
 
-        result = json.loads(response.data)
+        result = response.json()
         assert result["success"] is True
         assert result["message"] == "Successfully added message to pipeline!"
         assert result["data"]["message"] == encoded_msg
@@ -34,3 +41,47 @@ class TestRESTfulServiceApp:
         assert (
             decoders.from_json(result["data"]["message"]) == msg
         )  # Test idempotency while we're at it.
+
+        # Wait for separate tasks to complete
+        tasks = asyncio.all_tasks()
+        await asyncio.wait(tasks, timeout=0.1)
+
+        api_app.pipeline.send.assert_called_once_with(msg)
+
+    def test_address_defaults_to_settings(self):
+        api_app = RESTfulServiceApp(MagicMock(BasePipeline))
+
+        assert api_app.host == settings.REST_API_HOST
+        assert api_app.port == settings.REST_API_PORT
+
+    @pytest.mark.asyncio
+    async def test_start_and_stop_serves_api(self, unused_tcp_port):
+        api_app = RESTfulServiceApp(MagicMock(BasePipeline), port=unused_tcp_port)
+        await api_app.initialize()
+
+        await api_app.start()
+        try:
+            async with httpx.AsyncClient() as client:
+                response = await client.get(f"http://127.0.0.1:{unused_tcp_port}/")
+
+            assert response.status_code == 200
+            assert response.json()["success"] is True
+        finally:
+            await api_app.stop()
+
+        assert api_app._server_task.done()
+
+    @pytest.mark.asyncio
+    async def test_start_raises_exception_if_port_in_use(self, unused_tcp_port):
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", unused_tcp_port))
+            sock.listen()
+
+            api_app = RESTfulServiceApp(MagicMock(BasePipeline), port=unused_tcp_port)
+            await api_app.initialize()
+
+            with pytest.raises(RuntimeError):
+                await api_app.start()
+
+        # Nothing left to shut down.
+        await api_app.stop()
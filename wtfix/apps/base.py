@@ -16,6 +16,7 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 from functools import wraps
 
+from wtfix.core import utils
 from wtfix.core.exceptions import ValidationError, MessageProcessingError
 from wtfix.message.message import FIXMessage
 from wtfix.pipeline import BasePipeline
@@ -133,13 +134,14 @@ def on(message_type):
             # Do something with the execution report
             return message # Pass the message on for further processing.
 
-    :param message_type: The type of message to be processed.
+    :param message_type: The type of message to be processed. Byte strings are decoded so that handlers are always
+    keyed by the same string values that FIXMessage.type returns.
     :return: a decorator that can be used with a MessageTypeHandlerApp method.
     """
 
     @wraps(message_type)
     def wrapper(f):
-        f.on_type = message_type
+        f.on_type = utils.decode(message_type)
         return f
 
     return wrapper
@@ -152,26 +154,38 @@ class MessageTypeHandlerApp(BaseApp):
 
     name = "type_filter"
 
-    def __init__(self, pipeline: BasePipeline, *args, **kwargs):
-        super().__init__(pipeline, *args, **kwargs)
+    # Maps message types to the names of the 'on_' methods that handle them.
+    _type_handler_names = {}
 
-        self.type_handlers = {}
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
 
-        # Find all callable methods for this app
-        method_list = [
-            getattr(self, func)
-            for func in dir(self)
-            if callable(getattr(self, func)) and not func.startswith("__")
-        ]
+        # Find the 'on_' handlers once when the class is defined, instead of every time that an app is instantiated.
+        attributes = {
+            attr
+            for klass in cls.__mro__
+            for attr in vars(klass)
+            if not attr.startswith("__")
+        }
 
-        # See if an 'on_' handler is defined for each method
-        for method in method_list:
+        cls._type_handler_names = {}
+        for attr in sorted(attributes):
             try:
-                self.type_handlers[getattr(method, "on_type")] = method
+                cls._type_handler_names[getattr(cls, attr).on_type] = attr
             except AttributeError:
-                # Method is not a message type pipeline, ignore
+                # Not a message type handler, ignore
                 pass
 
+    def __init__(self, pipeline: BasePipeline, *args, **kwargs):
+        super().__init__(pipeline, *args, **kwargs)
+
+        # Bind the handlers once, instead of looking them up for every message. Use a plain dict: lookups are
+        # faster than through a read-only proxy, and subclasses can still register handlers at runtime.
+        self.type_handlers = {
+            message_type: getattr(self, attr)
+            for message_type, attr in self._type_handler_names.items()
+        }
+
     async def on_receive(self, message: FIXMessage) -> FIXMessage:
         """
         Calls the relevant on_<message_type> handler for this type of message, or 'on_unhandled' if no
@@ -181,7 +195,11 @@ class MessageTypeHandlerApp(BaseApp):
         :return: The result after processing the on_<message_type> method.
         :raises: MessageProcessingError if the handler does not return a valid FIX message.
         """
-        handler = self.type_handlers.get(message.type, self.on_unhandled)
+        handler = self.type_handlers.get(message.type)
+        if handler is None:
+            # Only look up the fallback handler when it is actually needed.
+            handler = self.on_unhandled
+
         message = await handler(message)
 
         if message is None:
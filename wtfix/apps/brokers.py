@@ -16,7 +16,7 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 import asyncio
 
-import aioredis
+from redis import asyncio as redis
 
 from wtfix.apps.base import BaseApp
 from wtfix.conf import settings
@@ -39,33 +39,25 @@ class RedisPubSubApp(BaseApp):
         super().__init__(pipeline, *args, **kwargs)
 
         self.redis_pool = None
+        self._pubsub = None
         self._channel_reader_task = None
 
     async def _send_channel_reader(self):
         try:
-            with await self.redis_pool as conn:
-                await conn.subscribe(self.SEND_CHANNEL)
+            await self._pubsub.subscribe(self.SEND_CHANNEL)
 
-                send_channel = conn.channels[self.SEND_CHANNEL]
-
-                while await send_channel.wait_message():
-                    message = await send_channel.get()
-                    message = decoders.from_json(utils.decode(message))
-                    asyncio.create_task(
-                        self.send(message)
-                    )  # Pass message on to pipeline
+            async for message in self._pubsub.listen():
+                message = decoders.from_json(utils.decode(message["data"]))
+                asyncio.create_task(self.send(message))  # Pass message on to pipeline
 
         except asyncio.exceptions.CancelledError:
             logger.info(f"{self.name}: {asyncio.current_task().get_name()} cancelled!")
 
-        except aioredis.ChannelClosedError:
-            # Shutting down...
-            logger.info(f"{self.name}: Unsubscribed from {send_channel.name}.")
-
     async def initialize(self, *args, **kwargs):
         await super().initialize(*args, **kwargs)
 
-        self.redis_pool = await aioredis.create_redis_pool(settings.REDIS_WTFIX_URI)
+        self.redis_pool = redis.from_url(settings.REDIS_WTFIX_URI)
+        self._pubsub = self.redis_pool.pubsub(ignore_subscribe_messages=True)
 
     async def start(self, *args, **kwargs):
         await super().start(*args, **kwargs)
@@ -79,10 +71,10 @@ class RedisPubSubApp(BaseApp):
             self._channel_reader_task.cancel()
             await self._channel_reader_task
 
-        with await self.redis_pool as conn:
-            await conn.unsubscribe(self.SEND_CHANNEL)
+        await self._pubsub.unsubscribe(self.SEND_CHANNEL)
+        logger.info(f"{self.name}: Unsubscribed from {self.SEND_CHANNEL}.")
 
-        self.redis_pool.close()
-        await self.redis_pool.wait_closed()  # Closing all open connections
+        await self._pubsub.aclose()
+        await self.redis_pool.aclose()  # Closing all open connections
 
         await super().stop(*args, **kwargs)
@@ -219,27 +219,27 @@ class ClientSessionApp(SessionApp):
             f"{connection.protocol.Tag.CheckSum}="
         )
 
-        data = []
-
         try:
             while not self.writer.is_closing():  # Listen forever for new messages
+                # Join the parts once, instead of copying the message for every part that is read.
+                parts = []
                 try:
                     # Try to read a complete message.
-                    data = await self.reader.readuntil(
-                        begin_string
+                    parts.append(
+                        await self.reader.readuntil(begin_string)
                     )  # Detect beginning of message.
                     # TODO: should there be a timeout for reading an entire message?
-                    data += await self.reader.readuntil(
-                        checksum_start
+                    parts.append(
+                        await self.reader.readuntil(checksum_start)
                     )  # Detect start of checksum field.
-                    data += await self.reader.readuntil(
-                        settings.SOH
+                    parts.append(
+                        await self.reader.readuntil(settings.SOH)
                     )  # Detect final message delimiter.
 
-                    await self.pipeline.receive(data)
-                    data = None
+                    await self.pipeline.receive(b"".join(parts))
 
                 except IncompleteReadError:
+                    data = b"".join(parts)
                     if (
                         data
                         and utils.encode(
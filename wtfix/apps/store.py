@@ -20,9 +20,10 @@ import numbers
 from collections import OrderedDict
 from typing import Union, List, Type
 
-import aioredis
 import abc
 
+from redis import asyncio as redis
+
 from wtfix.core.decoders import JSONMessageDecoder
 from wtfix.core.encoders import JSONMessageEncoder
 from wtfix.core.klass import get_class_from_module_string
@@ -81,6 +82,29 @@ class BaseStore(abc.ABC):
         :return: a FIXMessage object
         """
 
+    async def get_range(
+        self,
+        session_id: str,
+        originator: str,
+        begin_seq_num: numbers.Integral,
+        end_seq_num: numbers.Integral,
+    ) -> List[Union[FIXMessage, None]]:
+        """
+        Retrieves a contiguous range of messages from the store.
+
+        Stores that support bulk lookups should override this method to retrieve all of the messages at once.
+
+        :param session_id: The current session ID
+        :param originator: The originator of the messages
+        :param begin_seq_num: The sequence number of the first message to retrieve.
+        :param end_seq_num: The sequence number of the last message to retrieve (inclusive).
+        :return: a list of FIXMessage objects, with None in place of any messages that could not be found.
+        """
+        return [
+            await self.get(session_id, originator, seq_num)
+            for seq_num in range(begin_seq_num, end_seq_num + 1)
+        ]
+
     @abc.abstractmethod
     async def delete(
         self, session_id: str, originator: str, seq_num: Union[str, int]
@@ -106,6 +130,21 @@ class BaseStore(abc.ABC):
         :return: a list of sequence numbers
         """
 
+    async def last_seq_num(self, session_id: str, originator: str) -> int:
+        """
+        Retrieves the highest sequence number stored for the given session ID and originator.
+
+        Stores that can look up the last sequence number directly should override this method instead of
+        retrieving all of the stored sequence numbers.
+
+        :param session_id: The session ID to retrieve the sequence number for.
+        :param originator: The originator to retrieve the sequence number for.
+        :return: the last sequence number, or 0 if no messages have been stored yet.
+        """
+        seq_nums = await self.filter(session_id=session_id, originator=originator)
+
+        return seq_nums[-1] if seq_nums else 0
+
     @classmethod
     def get_key(cls, session_id: str, originator: str, seq_num: Union[str, int]) -> str:
         return f"{session_id}:{originator}:{seq_num}"
@@ -174,42 +213,64 @@ class RedisStore(BaseStore):
     async def initialize(self, *args, **kwargs):
         await super().initialize(*args, **kwargs)
 
-        self.redis_pool = await aioredis.create_redis_pool(settings.REDIS_WTFIX_URI)
+        self.redis_pool = redis.from_url(settings.REDIS_WTFIX_URI)
 
     async def finalize(self, *args, **kwargs):
         await super().finalize(*args, **kwargs)
 
-        self.redis_pool.close()
-        await self.redis_pool.wait_closed()  # Closing all open connections
+        await self.redis_pool.aclose()  # Closing all open connections
 
     async def set(self, session_id: str, originator: str, message: FIXMessage):
-        with await self.redis_pool as conn:
-            return await conn.execute(
-                "set",
-                self.get_key(session_id, originator, message.seq_num),
-                json.dumps(message, cls=self.encoder),
-            )
+        return await self.redis_pool.set(
+            self.get_key(session_id, originator, message.seq_num),
+            json.dumps(message, cls=self.encoder),
+        )
 
     async def get(
         self, session_id: str, originator: str, seq_num: Union[str, int]
     ) -> Union[FIXMessage, None]:
 
-        with await self.redis_pool as conn:
-            json_message = await conn.execute(
-                "get", self.get_key(session_id, originator, seq_num)
-            )
+        json_message = await self.redis_pool.get(
+            self.get_key(session_id, originator, seq_num)
+        )
+
+        if json_message is not None:
+            return json.loads(json_message, cls=self.decoder)
+        return json_message
+
+    async def get_range(
+        self,
+        session_id: str,
+        originator: str,
+        begin_seq_num: numbers.Integral,
+        end_seq_num: numbers.Integral,
+    ) -> List[Union[FIXMessage, None]]:
+        if end_seq_num < begin_seq_num:
+            return []
+
+        # Retrieve all of the messages in a single round trip.
+        json_messages = await self.redis_pool.mget(
+            [
+                self.get_key(session_id, originator, seq_num)
+                for seq_num in range(begin_seq_num, end_seq_num + 1)
+            ]
+        )
 
-            if json_message is not None:
-                return json.loads(json_message, cls=self.decoder)
-            return json_message
+        return [
+            (
+                json.loads(json_message, cls=self.decoder)
+                if json_message is not None
+                else None
+            )
+            for json_message in json_messages
+        ]
 
     async def delete(
         self, session_id: str, originator: str, seq_num: Union[str, int]
     ) -> int:
-        with await self.redis_pool as conn:
-            return await conn.execute(
-                "del", self.get_key(session_id, originator, seq_num)
-            )
+        return await self.redis_pool.delete(
+            self.get_key(session_id, originator, seq_num)
+        )
 
     async def filter(
         self, *, session_id: str = "*", originator: str = "*"
@@ -217,16 +278,25 @@ class RedisStore(BaseStore):
 
         matches = list()
 
-        with await self.redis_pool as conn:
-            cur = b"0"  # set initial cursor to 0
-            while cur:
-                cur, keys = await conn.scan(cur, match=f"{session_id}:{originator}:*")
-                for key in keys:
-                    store_id, store_origin, seq_num = utils.decode(key).split(":")
-                    matches.append(int(seq_num))
+        async for key in self.redis_pool.scan_iter(
+            match=f"{session_id}:{originator}:*"
+        ):
+            store_id, store_origin, seq_num = utils.decode(key).split(":")
+            matches.append(int(seq_num))
 
         return sorted(matches)
 
+    async def last_seq_num(self, session_id: str, originator: str) -> int:
+        last_seq_num = 0
+
+        # Keep track of the maximum while scanning, instead of collecting and sorting every sequence number.
+        async for key in self.redis_pool.scan_iter(
+            match=f"{session_id}:{originator}:*"
+        ):
+            last_seq_num = max(last_seq_num, int(utils.decode(key).rsplit(":", 1)[1]))
+
+        return last_seq_num
+
 
 class MessageStoreApp(BaseApp):
     """
@@ -282,6 +352,16 @@ class MessageStoreApp(BaseApp):
             self._session_app.session_id, self._session_app.sender, seq_num
         )
 
+    async def get_sent_range(
+        self, begin_seq_num: numbers.Integral, end_seq_num: numbers.Integral
+    ) -> List[Union[FIXMessage, None]]:
+        return await self.store.get_range(
+            self._session_app.session_id,
+            self._session_app.sender,
+            begin_seq_num,
+            end_seq_num,
+        )
+
     async def set_sent(self, message: FIXMessage):
         return await self.store.set(
             self._session_app.session_id, self._session_app.sender, message
@@ -1,5 +1,5 @@
 import asyncio
-from datetime import datetime, timedelta
+import time
 from unittest import mock
 from unittest.mock import MagicMock
 
@@ -159,6 +159,29 @@ class TestHeartbeatApp:
 
         assert not zero_heartbeat_app._server_not_responding.is_set()
 
+    @pytest.mark.asyncio
+    async def test_send_test_request_uses_unique_ids(self, zero_heartbeat_app):
+        await zero_heartbeat_app.send_test_request()
+        first_request_id = zero_heartbeat_app._test_request_id
+
+        await zero_heartbeat_app.send_test_request()
+
+        assert zero_heartbeat_app._test_request_id != first_request_id
+
+    @pytest.mark.asyncio
+    async def test_send_test_request_ids_differ_between_instances(
+        self, zero_heartbeat_app, base_pipeline
+    ):
+        # E.g. after reconnecting
+        other_heartbeat_app = type(zero_heartbeat_app)(base_pipeline)
+
+        await zero_heartbeat_app.send_test_request()
+        await other_heartbeat_app.send_test_request()
+
+        assert (
+            zero_heartbeat_app._test_request_id != other_heartbeat_app._test_request_id
+        )
+
     @pytest.mark.asyncio
     async def test_send_test_request_no_response(self, zero_heartbeat_app):
         await zero_heartbeat_app.send_test_request()
@@ -205,10 +228,30 @@ class TestHeartbeatApp:
 
     @pytest.mark.asyncio
     async def test_on_receive_updated_timestamp(self, zero_heartbeat_app):
-        prev_timestamp = HeartbeatTimers.RECEIVE.timestamp
+        prev_timestamp = zero_heartbeat_app._receive_timestamp
 
         await zero_heartbeat_app.on_receive(TestRequestMessage("test123"))
-        assert HeartbeatTimers.RECEIVE.timestamp != prev_timestamp
+        assert zero_heartbeat_app._receive_timestamp != prev_timestamp
+
+    def test_seconds_to_next_check_uses_timer(self, base_pipeline):
+        heartbeat_app = HeartbeatApp(base_pipeline)
+        heartbeat_app._send_timestamp = (
+            time.monotonic() - heartbeat_app.heartbeat_interval
+        )
+        heartbeat_app._receive_timestamp = time.monotonic()
+
+        assert heartbeat_app.seconds_to_next_check(HeartbeatTimers.SEND) == 0
+        assert heartbeat_app.seconds_to_next_check(HeartbeatTimers.RECEIVE) > 0
+
+    @pytest.mark.asyncio
+    async def test_timers_are_not_shared_between_instances(self, base_pipeline):
+        heartbeat_app = HeartbeatApp(base_pipeline)
+        other_heartbeat_app = HeartbeatApp(base_pipeline)
+
+        await heartbeat_app.on_send(TestRequestMessage("test123"))
+
+        assert heartbeat_app._send_timestamp is not None
+        assert other_heartbeat_app._send_timestamp is None
 
 
 class TestSeqNumManagerApp:
@@ -283,9 +326,8 @@ class TestSeqNumManagerApp:
     ):
         with pytest.raises(StopMessageProcessing):
             seq_num_app = SeqNumManagerApp(pipeline_with_messages)
-            seq_num_app.startup_time = datetime.utcnow() - timedelta(
-                seconds=5
-            )  # Don't wait
+            await seq_num_app.initialize()
+            seq_num_app.startup_time = time.monotonic() - 5  # Don't wait
 
             email_message.MsgSeqNum = 99
             await seq_num_app._handle_sequence_number_too_high(email_message)
@@ -295,7 +337,7 @@ class TestSeqNumManagerApp:
         await asyncio.wait(tasks, timeout=0.1)
 
         assert len(seq_num_app.receive_buffer) == 1
-        assert seq_num_app.receive_buffer[0] == email_message
+        assert seq_num_app.receive_buffer[99] == email_message
         assert pipeline_with_messages.send.call_count == 1
 
     @pytest.mark.asyncio
@@ -303,9 +345,8 @@ class TestSeqNumManagerApp:
         self, pipeline_with_messages, email_message
     ):
         seq_num_app = SeqNumManagerApp(pipeline_with_messages)
-        seq_num_app.startup_time = datetime.utcnow() - timedelta(
-            seconds=5
-        )  # Don't wait
+        await seq_num_app.initialize()
+        seq_num_app.startup_time = time.monotonic() - 5  # Don't wait
 
         for idx in range(5):
             out_of_sequence_msg = email_message.copy()
@@ -323,15 +364,55 @@ class TestSeqNumManagerApp:
         assert len(seq_num_app.receive_buffer) == 5
         assert pipeline_with_messages.send.call_count == 1
 
+    @pytest.mark.asyncio
+    async def test_handle_seq_num_too_high_ignores_duplicates_received_out_of_order(
+        self, pipeline_with_messages, email_message
+    ):
+        seq_num_app = SeqNumManagerApp(pipeline_with_messages)
+        await seq_num_app.initialize()
+        seq_num_app.startup_time = time.monotonic() - 5  # Don't wait
+
+        first_msg = None
+        for seq_num in [5, 8, 6, 8, 9, 5]:
+            out_of_sequence_msg = email_message.copy()
+            out_of_sequence_msg.MsgSeqNum = seq_num
+            first_msg = first_msg or out_of_sequence_msg
+            try:
+                await seq_num_app._handle_sequence_number_too_high(out_of_sequence_msg)
+            except StopMessageProcessing:
+                # Expected
+                pass
+
+        # Wait for separate 'send' tasks to complete
+        tasks = asyncio.all_tasks()
+        await asyncio.wait(tasks, timeout=0.1)
+
+        assert sorted(seq_num_app.receive_buffer) == [5, 6, 8, 9]
+        assert seq_num_app.receive_buffer[5] is first_msg
+        assert pipeline_with_messages.send.call_count == 1
+
+    def test_handle_sequence_reset_discards_buffered_messages(
+        self, pipeline_with_messages, email_message
+    ):
+        seq_num_app = SeqNumManagerApp(pipeline_with_messages)
+
+        for seq_num in [5, 6, 8, 9]:
+            out_of_sequence_msg = email_message.copy()
+            out_of_sequence_msg.MsgSeqNum = seq_num
+            seq_num_app.receive_buffer[seq_num] = out_of_sequence_msg
+
+        seq_num_app._handle_sequence_reset(admin.SequenceResetMessage(1, 8))
+
+        assert sorted(seq_num_app.receive_buffer) == [8, 9]
+        assert seq_num_app.expected_seq_num == 8
+
     @pytest.mark.asyncio
     async def test_send_resend_request_waits_for_target_before_doing_gapfill(
         self, pipeline_with_messages
     ):
 
         seq_num_app = SeqNumManagerApp(pipeline_with_messages)
-        seq_num_app.startup_time = datetime.utcnow() - timedelta(
-            seconds=5
-        )  # Don't wait
+        seq_num_app.startup_time = time.monotonic() - 5  # Don't wait
         assert not seq_num_app.waited_for_resend_request_event.is_set()
 
         await seq_num_app._send_resend_request([1, 2])
@@ -343,9 +424,7 @@ class TestSeqNumManagerApp:
         self, pipeline_with_messages
     ):
         seq_num_app = SeqNumManagerApp(pipeline_with_messages)
-        seq_num_app.startup_time = datetime.utcnow() - timedelta(
-            seconds=5
-        )  # Don't wait
+        seq_num_app.startup_time = time.monotonic() - 5  # Don't wait
 
         await seq_num_app._send_resend_request([1, 2])
 
@@ -360,6 +439,7 @@ class TestSeqNumManagerApp:
         self, pipeline_with_messages
     ):
         seq_num_app = SeqNumManagerApp(pipeline_with_messages)
+        await seq_num_app.initialize()
         seq_num_app.send_seq_num = 3  # 3 messages sent so far
         resend_begin_seq_num = 2  # Simulate resend request of 2 and 3
 
@@ -387,6 +467,7 @@ class TestSeqNumManagerApp:
         self, logon_message, pipeline_with_messages, messages
     ):
         seq_num_app = SeqNumManagerApp(pipeline_with_messages)
+        await seq_num_app.initialize()
 
         admin_messages = [logon_message, HeartbeatMessage("test123")]
 
@@ -438,8 +519,9 @@ class TestSeqNumManagerApp:
         self, pipeline_with_messages, email_message
     ):
         seq_num_app = SeqNumManagerApp(pipeline_with_messages)
-        seq_num_app.startup_time = datetime.utcnow() - timedelta(
-            seconds=10
+        await seq_num_app.initialize()
+        seq_num_app.startup_time = (
+            time.monotonic() - 10
         )  # Don't wait for resend requests
 
         seq_num_app.receive_seq_num = 5  # 5 Messages received so far
@@ -463,6 +545,130 @@ class TestSeqNumManagerApp:
         tasks = asyncio.all_tasks()
         await asyncio.wait(tasks, timeout=0.1)
 
-        assert (
-            pipeline_with_messages.receive.call_count == 1
-        )  # One queued message (with sequence number 8) processed
+        # One queued message (with sequence number 8) processed
+        pipeline_with_messages.reinject.assert_called_once_with(
+            email_message, MessageStoreApp.name
+        )
+
+    @pytest.mark.asyncio
+    async def test_on_receive_replays_queued_messages_in_order(
+        self, pipeline_with_messages, email_message
+    ):
+        seq_num_app = SeqNumManagerApp(pipeline_with_messages)
+        await seq_num_app.initialize()
+        seq_num_app.startup_time = (
+            time.monotonic() - 10
+        )  # Don't wait for resend requests
+
+        async def reinject(message, app_name):
+            # Replayed messages pass through the sequence number manager again.
+            return await seq_num_app.on_receive(message)
+
+        pipeline_with_messages.reinject.side_effect = reinject
+
+        seq_num_app.receive_seq_num = 5  # 5 Messages received so far
+
+        # Simulate missing messages 6 and 7
+        for seq_num in [10, 8, 9]:
+            message = email_message.copy()
+            message.seq_num = seq_num
+            if seq_num == 9:
+                message.MsgType = connection.protocol.MsgType.Heartbeat
+
+            try:
+                await seq_num_app.on_receive(message)
+            except StopMessageProcessing:
+                # Expected
+                pass
+
+        # Simulate resend of 6 and 7
+        for seq_num in [6, 7]:
+            message = email_message.copy()
+            message.seq_num = seq_num
+            message.PossDupFlag = True
+            await seq_num_app.on_receive(message)
+
+        # Wait for separate 'send' tasks to complete
+        tasks = asyncio.all_tasks()
+        await asyncio.wait(tasks, timeout=0.1)
+
+        # Admin message with sequence number 9 is skipped
+        assert [
+            call.args[0].seq_num for call in pipeline_with_messages.reinject.mock_calls
+        ] == [8, 10]
+        # Replaying the queued messages does not trigger any further resend requests
+        assert pipeline_with_messages.send.call_count == 1
+        assert seq_num_app.receive_seq_num == 10
+        assert len(seq_num_app.receive_buffer) == 0
+
+    @pytest.mark.asyncio
+    async def test_on_receive_requests_each_gap(
+        self, pipeline_with_messages, email_message
+    ):
+        seq_num_app = SeqNumManagerApp(pipeline_with_messages)
+        await seq_num_app.initialize()
+        seq_num_app.startup_time = (
+            time.monotonic() - 10
+        )  # Don't wait for resend requests
+
+        async def reinject(message, app_name):
+            # Replayed messages pass through the sequence number manager again.
+            return await seq_num_app.on_receive(message)
+
+        pipeline_with_messages.reinject.side_effect = reinject
+
+        seq_num_app.receive_seq_num = 5  # 5 Messages received so far
+
+        # Simulate missing messages 6, 7 and 9
+        for seq_num in [8, 10, 6, 7, 11, 12, 9]:
+            message = email_message.copy()
+            message.seq_num = seq_num
+            if seq_num in [6, 7, 9]:
+                message.PossDupFlag = True
+
+            try:
+                await seq_num_app.on_receive(message)
+            except StopMessageProcessing:
+                # Expected
+                pass
+
+            # Wait for separate 'send' tasks to complete
+            tasks = asyncio.all_tasks()
+            await asyncio.wait(tasks, timeout=0.1)
+
+        assert [
+            (call.args[0].BeginSeqNo, call.args[0].EndSeqNo)
+            for call in pipeline_with_messages.send.mock_calls
+        ] == [(6, 7), (9, 9)]
+        assert [
+            call.args[0].seq_num for call in pipeline_with_messages.reinject.mock_calls
+        ] == [8, 10, 11, 12]
+        assert seq_num_app.receive_seq_num == 12
+        assert len(seq_num_app.receive_buffer) == 0
+
+    @pytest.mark.asyncio
+    async def test_on_send_sets_sequence_number(self, email_message):
+        pipeline_mock = MagicMock(BasePipeline)
+        seq_num_app = SeqNumManagerApp(pipeline_mock)
+        seq_num_app.send_seq_num = 10
+
+        message = await seq_num_app.on_send(email_message)
+
+        assert message.seq_num == 11
+        assert seq_num_app.send_seq_num == 11
+
+    @pytest.mark.asyncio
+    async def test_on_send_does_not_change_sequence_number_of_duplicates(
+        self, email_message
+    ):
+        pipeline_mock = MagicMock(BasePipeline)
+        seq_num_app = SeqNumManagerApp(pipeline_mock)
+        seq_num_app.send_seq_num = 10
+
+        email_message.MsgSeqNum = 3
+        email_message.PossDupFlag = True
+
+        message = await seq_num_app.on_send(email_message)
+
+        assert message.seq_num == 3
+        assert seq_num_app.send_seq_num == 10
@@ -55,6 +55,29 @@ class MockApp(MessageTypeHandlerApp):
 
 
 class TestMessageTypeHandlerApp:
+    def test_init_finds_inherited_handlers(self):
+        class SubclassedMockApp(MockApp):
+            @on("b")
+            async def on_b(self, message):
+                return message
+
+        app = SubclassedMockApp("mock_app")
+
+        assert app.type_handlers.keys() == {"a", "b", "z"}
+        assert app.type_handlers["a"] == app.on_a
+
+    def test_on_decodes_bytes_message_types(self):
+        class BytesMockApp(MessageTypeHandlerApp):
+            name = "bytes_mock_app"
+
+            @on(b"c")
+            async def on_c(self, message):
+                return message
+
+        app = BytesMockApp("mock_app")
+
+        assert app.type_handlers.keys() == {"c"}
+
     @pytest.mark.asyncio
     async def test_on_receive_handler(self):
 
@@ -71,6 +94,21 @@ class TestMessageTypeHandlerApp:
         assert app.counter["b"] == 0
         assert app.counter["unhandled"] == 1
 
+    @pytest.mark.asyncio
+    async def test_on_receive_uses_handlers_registered_at_runtime(self):
+        app = MockApp("mock_app")
+
+        async def on_b(message):
+            app.counter["b"] += 1
+            return message
+
+        app.type_handlers["b"] = on_b
+
+        await app.on_receive(generic_message_factory((35, "b")))
+
+        assert app.counter["b"] == 1
+        assert app.counter["unhandled"] == 0
+
     @pytest.mark.asyncio
     async def test_on_receive_handler_raises_exception_if_message_not_returned(self):
         with pytest.raises(MessageProcessingError):
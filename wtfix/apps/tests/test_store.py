@@ -19,8 +19,7 @@ class TestBaseStore:
         await store.initialize()
 
         if isinstance(store, RedisStore):
-            with await store.redis_pool as conn:
-                await conn.execute("flushall")
+            await store.redis_pool.flushall()
 
         session_id = uuid.uuid4().hex
         await store.set(session_id, "TRADER", email_message)
@@ -39,8 +38,7 @@ class TestBaseStore:
         await store.initialize()
 
         if isinstance(store, RedisStore):
-            with await store.redis_pool as conn:
-                await conn.execute("flushall")
+            await store.redis_pool.flushall()
 
         assert await store.get(uuid.uuid4().hex, "TRADER", 123) is None
 
@@ -50,6 +48,31 @@ class TestBaseStore:
 
         await store.finalize()
 
+    @pytest.mark.parametrize("store_class", [MemoryStore, RedisStore])
+    @pytest.mark.asyncio
+    async def test_get_range(self, store_class, email_message):
+        store = store_class()
+        await store.initialize()
+
+        if isinstance(store, RedisStore):
+            await store.redis_pool.flushall()
+
+        session_id = uuid.uuid4().hex
+
+        # Add some messages
+        for idx in range(5):
+            await store.set(session_id, "TRADER", email_message)
+            email_message.seq_num += 1
+
+        messages = await store.get_range(session_id, "TRADER", 2, 6)
+
+        assert len(messages) == 5
+        assert all(message is not None for message in messages[:-1])
+        assert messages[-1] is None  # Does not exist
+        assert await store.get_range(session_id, "TRADER", 3, 2) == []
+
+        await store.finalize()
+
     @pytest.mark.parametrize("store_class", [MemoryStore, RedisStore])
     @pytest.mark.asyncio
     async def test_delete(self, store_class, email_message):
@@ -57,8 +80,7 @@ class TestBaseStore:
         await store.initialize()
 
         if isinstance(store, RedisStore):
-            with await store.redis_pool as conn:
-                await conn.execute("flushall")
+            await store.redis_pool.flushall()
 
         session_id = uuid.uuid4().hex
 
@@ -72,6 +94,29 @@ class TestBaseStore:
 
         await store.finalize()
 
+    @pytest.mark.parametrize("store_class", [MemoryStore, RedisStore])
+    @pytest.mark.asyncio
+    async def test_last_seq_num(self, store_class, email_message):
+        store = store_class()
+        await store.initialize()
+
+        if isinstance(store, RedisStore):
+            await store.redis_pool.flushall()
+
+        session_id = uuid.uuid4().hex
+
+        assert await store.last_seq_num(session_id, "TRADER") == 0
+
+        # Add some messages
+        for seq_num in [9, 10, 2]:
+            email_message.seq_num = seq_num
+            await store.set(session_id, "TRADER", email_message)
+
+        assert await store.last_seq_num(session_id, "TRADER") == 10
+        assert await store.last_seq_num(session_id, "OTHER") == 0
+
+        await store.finalize()
+
     @pytest.mark.parametrize("store_class", [MemoryStore, RedisStore])
     @pytest.mark.asyncio
     async def test_filter_all(self, store_class, email_message):
@@ -79,8 +124,7 @@ class TestBaseStore:
         await store.initialize()
 
         if isinstance(store, RedisStore):
-            with await store.redis_pool as conn:
-                await conn.execute("flushall")
+            await store.redis_pool.flushall()
 
         session_id = uuid.uuid4().hex
 
@@ -103,8 +147,7 @@ class TestBaseStore:
         await store.initialize()
 
         if isinstance(store, RedisStore):
-            with await store.redis_pool as conn:
-                await conn.execute("flushall")
+            await store.redis_pool.flushall()
 
         session_id = uuid.uuid4().hex
         other_session_id = uuid.uuid4().hex
@@ -129,8 +172,7 @@ class TestBaseStore:
         await store.initialize()
 
         if isinstance(store, RedisStore):
-            with await store.redis_pool as conn:
-                await conn.execute("flushall")
+            await store.redis_pool.flushall()
 
         session_id = uuid.uuid4().hex
 
@@ -156,8 +198,7 @@ class TestBaseStore:
         await store.initialize()
 
         if isinstance(store, RedisStore):
-            with await store.redis_pool as conn:
-                await conn.execute("flushall")
+            await store.redis_pool.flushall()
 
         session_id = uuid.uuid4().hex
         other_session_id = uuid.uuid4().hex
@@ -200,7 +241,7 @@ class TestRedisStore:
         store = RedisStore()
         await store.initialize()
 
-        assert await store.redis_pool is not None
+        assert store.redis_pool is not None
 
         await store.finalize()
 
@@ -245,3 +286,18 @@ class TestMessageStoreApp:
             assert await store_app.get_sent(next_message.seq_num) == next_message
 
         await store_app.stop()
+
+    @pytest.mark.asyncio
+    async def test_get_sent_range(self, messages, base_pipeline):
+        store_app = MessageStoreApp(base_pipeline, store=MemoryStore)
+        await store_app.initialize()
+
+        for next_message in messages:
+            await store_app.on_send(next_message)
+
+        assert (
+            await store_app.get_sent_range(messages[0].seq_num, messages[-1].seq_num)
+            == messages
+        )
+
+        await store_app.stop()
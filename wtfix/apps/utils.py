@@ -14,6 +14,8 @@
 #
 # You should have received a copy of the GNU Lesser General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import logging
+
 from wtfix.apps.base import BaseApp
 from wtfix.conf import settings
 from wtfix.message.message import FIXMessage
@@ -29,7 +31,9 @@ class OutboundLoggingApp(BaseApp):
     name = "outbound_logger"
 
     async def on_send(self, message: FIXMessage) -> FIXMessage:
-        logger.info(f" --> {message:t}")
+        if logger.isEnabledFor(logging.INFO):
+            # Formatting the whole message is expensive: skip it if the log record would be discarded.
+            logger.info(f" --> {message:t}")
 
         return message
 
@@ -42,7 +46,9 @@ class InboundLoggingApp(BaseApp):
     name = "inbound_logger"
 
     async def on_receive(self, message: FIXMessage) -> FIXMessage:
-        logger.info(f" <-- {message:t}")
+        if logger.isEnabledFor(logging.INFO):
+            # Formatting the whole message is expensive: skip it if the log record would be discarded.
+            logger.info(f" <-- {message:t}")
 
         return message
 
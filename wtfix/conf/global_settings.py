@@ -60,5 +60,9 @@ INIT_TIMEOUT = 10
 STARTUP_TIMEOUT = 10
 STOP_TIMEOUT = 5
 
+# Address that the REST API server of the RESTfulServiceApp listens on
+REST_API_HOST = "127.0.0.1"
+REST_API_PORT = 5000
+
 # Default formatting for datetime objects.
 DATETIME_FORMAT = "%Y%m%d-%H:%M:%S.%f"
@@ -643,8 +643,12 @@ class FieldDict(FieldMap, GroupTemplateMixin):
         if tag in self._data:
             return True
 
-        # Fallback, might be a group tag - search full field list
-        return super().__contains__(tag)
+        # Fallback, might be a group tag - only the repeating groups need to be searched
+        for field in self._data.values():
+            if isinstance(field, Group) and tag in field:
+                return True
+
+        return False
 
     def values(self) -> Generator[Field, None, None]:
         for field in self.data.values():
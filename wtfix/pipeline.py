@@ -16,6 +16,8 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import asyncio
+import itertools
+import logging
 from collections import OrderedDict
 from typing import Union, List, Tuple
 
@@ -67,7 +69,7 @@ class BasePipeline:
         """
         Loads the list of apps to be used for processing messages.
 
-        :param installed_apps: The list of class paths for the installed apps.
+        :param installed_apps: The list of class paths, or classes, for the installed apps.
         :returns: An ordered dictionary containing all of the apps that have been loaded.
         """
         loaded_apps = OrderedDict()
@@ -81,7 +83,11 @@ class BasePipeline:
             )
 
         for app in installed_apps:
-            class_ = get_class_from_module_string(app)
+            if isinstance(app, str):
+                class_ = get_class_from_module_string(app)
+            else:
+                class_ = app  # Class reference provided directly, no need to import anything.
+
             instance = class_(self, **kwargs)
 
             loaded_apps[instance.name] = instance
@@ -199,19 +205,29 @@ class BasePipeline:
         )
 
     async def _process_message(
-        self, message: Union[FIXMessage, bytes], direction: int
+        self, message: Union[FIXMessage, bytes], direction: int, start_app: str = None
     ) -> Union[FIXMessage, bytes]:
         """
         Process a message by passing it on to the various apps in the pipeline.
 
         :param message: The GenericMessage instance to process
         :param direction: 0 if this is an inbound message, 1 otherwise.
+        :param start_app: Optional. The name of the app to start processing at. All of the apps that come before it
+        in the processing direction are skipped.
 
         :return: The processed message.
         """
 
         method_name, app_chain = self._setup_message_handling(direction)
 
+        if start_app is not None:
+            if start_app not in self._active_apps:
+                raise ValidationError(f"App '{start_app}' is not active.")
+
+            app_chain = itertools.dropwhile(
+                lambda app_: app_.name != start_app, app_chain
+            )
+
         try:
             for app in app_chain:
                 # Call the relevant 'on_send' or 'on_receive' method for each application
@@ -222,9 +238,11 @@ class BasePipeline:
                 f"Message processing error at '{app.name}': {e} ({message})."
             )
         except StopMessageProcessing as e:
-            logger.info(
-                f"Processing of message interrupted at '{app.name}': {e} ({message})."
-            )
+            if logger.isEnabledFor(logging.INFO):
+                # Formatting the whole message is expensive: skip it if the log record would be discarded.
+                logger.info(
+                    f"Processing of message interrupted at '{app.name}': {e} ({message})."
+                )
 
         except ImproperlyConfigured as e:
             # Raise configuration errors up to 'run_client'.
@@ -260,6 +278,22 @@ class BasePipeline:
 
         return await self._process_message(message, BasePipeline.INBOUND_PROCESSING)
 
+    async def reinject(self, message: FIXMessage, app_name: str) -> FIXMessage:
+        """
+        Re-submits an inbound message that has already been decoded and parsed, starting at the app called
+        'app_name'. Avoids encoding the message to bytes just so that the apps lower down in the pipeline can
+        parse it again.
+        """
+        if self.errors:
+            logger.warning(
+                f"Pipeline errors have occurred, ignoring reinjected message: {message}"
+            )
+            return message
+
+        return await self._process_message(
+            message, BasePipeline.INBOUND_PROCESSING, start_app=app_name
+        )
+
     async def send(self, message: FIXMessage) -> Union[FIXMessage, bytes]:
         """Processes a new message to be sent"""
         if self.errors:
@@ -20,6 +20,16 @@ class TestBasePipeline:
 
         assert len(pipeline.apps) == 3
 
+    def test_load_apps_accepts_class_references(self):
+        from wtfix.tests.conftest import Below, Middle, Top
+
+        with connection_manager() as conn:
+            pipeline = BasePipeline(
+                connection_name=conn.name, installed_apps=[Top, Middle, Below]
+            )
+
+        assert list(pipeline.apps.keys()) == ["top", "middle", "below"]
+
     def test_load_apps_falls_back_to_settings(self):
         with connection_manager() as conn:
             pipeline = BasePipeline(connection_name=conn.name)
@@ -289,6 +299,33 @@ class TestBasePipeline:
             message = await pipeline.receive(admin.TestRequestMessage("Test"))
             assert message.TestReqID == "Test r1 r2 r3"
 
+    @pytest.mark.asyncio
+    async def test_reinject(self, three_level_app_chain):
+        with connection_manager() as conn:
+            pipeline = BasePipeline(
+                connection_name=conn.name, installed_apps=three_level_app_chain
+            )
+
+            # Simulate all apps active
+            pipeline._active_apps = OrderedDict(pipeline.apps.items())
+
+            message = await pipeline.reinject(
+                admin.TestRequestMessage("Test"), "middle"
+            )
+            assert message.TestReqID == "Test r2 r3"
+
+    @pytest.mark.asyncio
+    async def test_reinject_raises_exception_if_app_not_active(
+        self, three_level_app_chain
+    ):
+        with connection_manager() as conn:
+            pipeline = BasePipeline(
+                connection_name=conn.name, installed_apps=three_level_app_chain
+            )
+
+            with pytest.raises(ValidationError):
+                await pipeline.reinject(admin.TestRequestMessage("Test"), "middle")
+
     @pytest.mark.asyncio
     async def test_receive_stop(self, three_level_stop_app_chain):
         with connection_manager() as conn: